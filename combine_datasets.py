@@ -4,24 +4,102 @@ Dataset combination script to merge rule-based and GPT-4 generated datasets
 into the ultimate comprehensive training dataset for forbidden word elimination.
 """
 
+import hashlib
+import functools
 import json
+import mmap
+import os
 import random
+import re
 import logging
-from typing import List, Dict
+import multiprocessing
+from collections import Counter, defaultdict
+from typing import List, Dict, Set, Tuple, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder/decoder
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Input files larger than this are memory-mapped and parsed straight from the page cache
+MMAP_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# Splits with more input samples than this keep 8-byte digests as duplicate keys
+COMPACT_DEDUP_THRESHOLD = 1_000_000
+
+# Inputs smaller than this in total are processed in this process; below it a worker
+# pool costs more to start and to pickle results back from than it saves
+PARALLEL_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Input files for each output split as (filename, source) pairs
+SPLIT_SOURCES = {
+    "train": [("train_dataset.json", "rule_based"), ("gpt_advanced_dataset.json", "gpt4_advanced")],
+    "validation": [("val_dataset.json", "rule_based")],
+    "test": [("test_dataset.json", "rule_based")],
+}
+
 class DatasetCombiner:
+    # Comprehensive forbidden variants, lowercased once at import
+    _FORBIDDEN_LOWER = frozenset(variant.lower() for variant in [
+        "orange", "Orange", "ORANGE", "OrAnGe", "oRaNgE", "0range", "0r4ng3", 
+        "or4nge", "oran9e", "0ran93", "o-r-a-n-g-e", "o r a n g e", "🍊",
+        "b3Jhbmdl", "T1JBTkdF", "egnaro"  # Base64 and reverse
+    ])
+    
+    # Single alternation over all variants so each sample is scanned once
+    _FORBIDDEN_PATTERN = re.compile("|".join(re.escape(variant) for variant in sorted(_FORBIDDEN_LOWER)))
+    
+    # A short substring of every variant: text containing none of these cannot match
+    _FORBIDDEN_ANCHORS = tuple(sorted({variant[1:4] or variant for variant in _FORBIDDEN_LOWER}))
+    
+    # Tag keywords for difficulty and priority, matched against "_"-separated tag tokens
+    _MAXIMUM_DIFFICULTY_ATTACKS = frozenset({"advanced", "sophisticated", "psychological"})
+    _HIGH_DIFFICULTY_CONTEXTS = frozenset({"prompt_injection", "encoding", "hangman"})
+    _MEDIUM_DIFFICULTY_CONTEXTS = frozenset({"adversarial", "roleplay", "technical"})
+    
+    # Priority categories keep all of their samples when balancing
+    _PRIORITY_CONTEXTS = frozenset({
+        "prompt_injection_defense", "gpt_sophisticated_injection", 
+        "hangman_puzzle", "encoding_obfuscation", "ultra_adversarial"
+    })
+    
+    # Low-cardinality tag fields whose equal values are collapsed to one shared string
+    _SHARED_TAG_FIELDS = ("context", "attack_type")
+    
+    # Statistics distributions as (statistics key, sample field, default value)
+    _STAT_FIELDS = (
+        ("contexts", "context", "unknown"),
+        ("attack_types", "attack_type", "unknown"),
+        ("difficulties", "difficulty", "standard"),
+        ("priorities", "priority", "medium"),
+        ("sources", "source", "unknown"),
+    )
+    
     def __init__(self):
         self.forbidden_word = "orange"
         
+        # Per-split field distributions collected while combining, reused for statistics
+        self.split_distributions: Dict[str, Dict[str, Counter]] = {}
+        
+        # (attack_type, context, source) -> (difficulty, priority)
+        self._tag_cache: Dict[Tuple[str, str, str], Tuple[str, str]] = {}
+        
     def load_dataset(self, filename: str) -> List[Dict]:
         """Load a dataset from JSON file"""
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                return json.load(f)
+            if orjson and os.path.getsize(filename) > MMAP_THRESHOLD_BYTES:
+                # Parse large files from the mapping instead of copying them into a bytes object
+                with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+            
+            with open(filename, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson else json.loads(raw)
         except FileNotFoundError:
             logger.warning(f"File {filename} not found, skipping...")
             return []
@@ -29,61 +107,107 @@ class DatasetCombiner:
             logger.error(f"Error loading {filename}: {e}")
             return []
     
+    def save_dataset(self, data, filename: str, pretty: bool = True):
+        """Save a dataset (or statistics) to a UTF-8 JSON file.
+        
+        pretty=False writes compact single-line JSON, which is much faster to
+        encode and smaller on disk for the large, machine-read dataset files.
+        """
+        if orjson:
+            option = orjson.OPT_INDENT_2 if pretty else orjson.OPT_APPEND_NEWLINE
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(data, option=option))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                if pretty:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+                    f.write("\n")
+    
     def validate_sample_safety(self, sample: Dict) -> bool:
         """Validate that a sample doesn't contain the forbidden word"""
-        text_to_check = f"{sample.get('instruction', '')} {sample.get('input', '')} {sample.get('output', '')}"
-        
-        # Comprehensive forbidden variants
-        forbidden_variants = [
-            "orange", "Orange", "ORANGE", "OrAnGe", "oRaNgE", "0range", "0r4ng3", 
-            "or4nge", "oran9e", "0ran93", "o-r-a-n-g-e", "o r a n g e", "🍊",
-            "b3Jhbmdl", "T1JBTkdF", "egnaro"  # Base64 and reverse
-        ]
-        
-        for variant in forbidden_variants:
-            if variant.lower() in text_to_check.lower():
-                return False
-                
-        return True
+        get = sample.get
+        text_to_check = " ".join((get("instruction") or "", get("input") or "", get("output") or "")).lower()
+        
+        # Cheap substring prefilter so most clean samples never reach the regex
+        if not any(anchor in text_to_check for anchor in self._FORBIDDEN_ANCHORS):
+            return True
+        
+        return self._FORBIDDEN_PATTERN.search(text_to_check) is None
     
-    def enhance_sample_metadata(self, sample: Dict, source: str) -> Dict:
-        """Enhance sample with additional metadata"""
-        enhanced_sample = sample.copy()
-        enhanced_sample["source"] = source
-        
-        # Add difficulty rating based on attack type
-        attack_type = sample.get("attack_type", "standard")
-        context = sample.get("context", "general")
-        
-        if any(keyword in attack_type for keyword in ["advanced", "sophisticated", "psychological"]):
-            enhanced_sample["difficulty"] = "maximum"
-        elif any(keyword in context for keyword in ["prompt_injection", "encoding", "hangman"]):
-            enhanced_sample["difficulty"] = "high"
-        elif any(keyword in context for keyword in ["adversarial", "roleplay", "technical"]):
-            enhanced_sample["difficulty"] = "medium"
+    @staticmethod
+    def _tag_tokens(tag: str) -> Set[str]:
+        """Split a tag like 'prompt_injection_defense' into its words and adjacent word pairs"""
+        words = tag.split("_")
+        return set(words).union(map("_".join, zip(words, words[1:])))
+    
+    def classify_sample(self, attack_type: str, context: str, source: str) -> Tuple[str, str]:
+        """Rate difficulty and training priority for a sample's tags"""
+        attack_tokens = self._tag_tokens(attack_type)
+        context_tokens = self._tag_tokens(context)
+        
+        # Difficulty rating based on attack type and context
+        if attack_tokens & self._MAXIMUM_DIFFICULTY_ATTACKS:
+            difficulty = "maximum"
+        elif context_tokens & self._HIGH_DIFFICULTY_CONTEXTS:
+            difficulty = "high"
+        elif context_tokens & self._MEDIUM_DIFFICULTY_CONTEXTS:
+            difficulty = "medium"
         else:
-            enhanced_sample["difficulty"] = "standard"
+            difficulty = "standard"
         
-        # Add training priority
+        # Training priority
         if "gpt" in source:
-            enhanced_sample["priority"] = "high"
-        elif any(keyword in context for keyword in ["prompt_injection", "hangman", "encoding"]):
-            enhanced_sample["priority"] = "high"
+            priority = "high"
+        elif context_tokens & self._HIGH_DIFFICULTY_CONTEXTS:
+            priority = "high"
         else:
-            enhanced_sample["priority"] = "medium"
-            
-        return enhanced_sample
+            priority = "medium"
+        
+        return difficulty, priority
+    
+    def enhance_sample_metadata(self, sample: Dict, source: str) -> Dict:
+        """Enhance sample with additional metadata.
+        
+        The sample is updated in place and returned; samples come straight from
+        load_dataset and are not shared, so copying them first is unnecessary.
+        """
+        sample["source"] = source
+        
+        # Tags come from a small vocabulary, so each combination is classified once
+        key = (sample.get("attack_type", "standard"), sample.get("context", "general"), source)
+        tags = self._tag_cache.get(key)
+        if tags is None:
+            tags = self._tag_cache[key] = self.classify_sample(*key)
+        sample["difficulty"], sample["priority"] = tags
+        
+        return sample
+    
+    @staticmethod
+    def _instruction_key(sample: Dict) -> Tuple[str, ...]:
+        """Simplified instruction used for duplicate detection (first 10 lowercased words)"""
+        # A tuple hashes without building a joined string
+        return tuple(sample.get("instruction", "").lower().split()[:10])
+    
+    @staticmethod
+    def _compact_instruction_key(sample: Dict) -> bytes:
+        """Fixed-size digest of the simplified instruction, for very large splits"""
+        simplified = " ".join(sample.get("instruction", "").lower().split()[:10])
+        return hashlib.blake2b(simplified.encode("utf-8"), digest_size=8).digest()
     
     def deduplicate_samples(self, samples: List[Dict]) -> List[Dict]:
-        """Remove duplicate samples based on instruction similarity"""
+        """Remove duplicate samples based on instruction similarity
+        
+        process_samples applies the same rule inside its single pass; this stays
+        available for deduplicating an already processed list on its own.
+        """
         seen_instructions = set()
         unique_samples = []
         duplicates_removed = 0
         
         for sample in samples:
-            instruction = sample.get("instruction", "").strip().lower()
-            # Create a simplified version for comparison
-            simplified = " ".join(instruction.split()[:10])  # First 10 words
+            simplified = self._instruction_key(sample)
             
             if simplified not in seen_instructions:
                 seen_instructions.add(simplified)
@@ -94,16 +218,63 @@ class DatasetCombiner:
         logger.info(f"Removed {duplicates_removed} duplicate samples")
         return unique_samples
     
-    def balance_dataset_categories(self, samples: List[Dict]) -> List[Dict]:
-        """Balance dataset to ensure good representation across categories"""
-        category_samples = {}
+    @classmethod
+    def _count_sample(cls, distributions: Dict[str, Counter], sample: Dict, count: int = 1):
+        """Add a sample's fields to per-field distributions (a negative count removes it)"""
+        for stat_key, field, default in cls._STAT_FIELDS:
+            distributions[stat_key][sample.get(field, default)] += count
+    
+    def process_samples(self, batches: Iterable[Tuple[List[Dict], str]], report: Counter,
+                        distributions: Optional[Dict[str, Counter]] = None,
+                        compact_keys: bool = False) -> Iterator[Dict]:
+        """Enhance, safety-validate and deduplicate samples in a single pass.
+        
+        Each batch is a (samples, source) pair; duplicates are detected across all
+        batches. Contaminated and duplicate counts are accumulated into report, and
+        every yielded sample is counted into distributions when one is given.
+        compact_keys stores 8-byte digests instead of word tuples in the duplicate
+        index, bounding its memory on very large inputs.
+        """
+        seen_instructions = set()
+        instruction_key = self._compact_instruction_key if compact_keys else self._instruction_key
+        # Local cache rather than sys.intern, so arbitrary input tags are not kept alive forever
+        shared_tags = {}
+        
+        for samples, source in batches:
+            for sample in samples:
+                for field in self._SHARED_TAG_FIELDS:
+                    value = sample.get(field)
+                    if isinstance(value, str):
+                        sample[field] = shared_tags.setdefault(value, value)
+                
+                enhanced_sample = self.enhance_sample_metadata(sample, source)
+                
+                if not self.validate_sample_safety(enhanced_sample):
+                    report["contaminated"] += 1
+                    continue
+                
+                simplified = instruction_key(enhanced_sample)
+                if simplified in seen_instructions:
+                    report["duplicates"] += 1
+                    continue
+                seen_instructions.add(simplified)
+                
+                if distributions is not None:
+                    self._count_sample(distributions, enhanced_sample)
+                
+                yield enhanced_sample
+    
+    def balance_dataset_categories(self, samples: List[Dict],
+                                   distributions: Optional[Dict[str, Counter]] = None) -> List[Dict]:
+        """Balance dataset to ensure good representation across categories.
+        
+        Samples dropped here are removed from distributions when one is given.
+        """
+        category_samples = defaultdict(list)
         
         # Group by context
         for sample in samples:
-            context = sample.get("context", "general")
-            if context not in category_samples:
-                category_samples[context] = []
-            category_samples[context].append(sample)
+            category_samples[sample.get("context", "general")].append(sample)
         
         # Calculate target sizes (ensure minimum representation)
         total_samples = len(samples)
@@ -111,20 +282,18 @@ class DatasetCombiner:
         
         balanced_samples = []
         
-        # Priority categories get more samples
-        priority_contexts = [
-            "prompt_injection_defense", "gpt_sophisticated_injection", 
-            "hangman_puzzle", "encoding_obfuscation", "ultra_adversarial"
-        ]
-        
         for context, context_samples in category_samples.items():
-            if context in priority_contexts:
+            if context in self._PRIORITY_CONTEXTS:
                 # Keep all samples for priority contexts
                 balanced_samples.extend(context_samples)
             else:
                 # Limit other contexts to maintain balance
                 max_samples = max(min_samples_per_category, len(context_samples) // 2)
                 balanced_samples.extend(context_samples[:max_samples])
+                
+                if distributions is not None:
+                    for dropped_sample in context_samples[max_samples:]:
+                        self._count_sample(distributions, dropped_sample, -1)
         
         logger.info(f"Balanced dataset from {total_samples} to {len(balanced_samples)} samples")
         return balanced_samples
@@ -133,51 +302,46 @@ class DatasetCombiner:
         """Combine all available datasets"""
         logger.info("🔄 Loading and combining all datasets...")
         
-        # Load all datasets
-        rule_based_train = self.load_dataset("train_dataset.json")
-        rule_based_val = self.load_dataset("val_dataset.json") 
-        rule_based_test = self.load_dataset("test_dataset.json")
-        gpt_advanced = self.load_dataset("gpt_advanced_dataset.json")
+        # Splits are independent, so large inputs are loaded, enhanced, validated and
+        # deduplicated with one worker process per split. Workers get a pickled copy of
+        # this combiner, so subclass overrides apply there too; state they build up,
+        # such as the tag cache, is not copied back
+        split_files = list(SPLIT_SOURCES.values())
+        input_bytes = sum(_file_size(filename) for files in split_files for filename, _source in files)
+        workers = min(len(split_files), os.cpu_count() or 1)
+        if workers > 1 and input_bytes > PARALLEL_THRESHOLD_BYTES:
+            with multiprocessing.Pool(workers) as pool:
+                processed = pool.map(functools.partial(_process_split, self), split_files)
+        else:
+            processed = [_process_split(self, files) for files in split_files]
+        results = dict(zip(SPLIT_SOURCES, processed))
         
         logger.info(f"Loaded datasets:")
-        logger.info(f"  - Rule-based train: {len(rule_based_train)} samples")
-        logger.info(f"  - Rule-based val: {len(rule_based_val)} samples")
-        logger.info(f"  - Rule-based test: {len(rule_based_test)} samples")
-        logger.info(f"  - GPT-4 advanced: {len(gpt_advanced)} samples")
-        
-        # Enhance all samples with metadata
-        enhanced_train = [self.enhance_sample_metadata(s, "rule_based") for s in rule_based_train]
-        enhanced_val = [self.enhance_sample_metadata(s, "rule_based") for s in rule_based_val]
-        enhanced_test = [self.enhance_sample_metadata(s, "rule_based") for s in rule_based_test]
-        enhanced_gpt = [self.enhance_sample_metadata(s, "gpt4_advanced") for s in gpt_advanced]
-        
-        # Combine all training data
-        all_training_samples = enhanced_train + enhanced_gpt
-        
-        # Safety validation
-        logger.info("🛡️ Performing comprehensive safety validation...")
-        safe_train = [s for s in all_training_samples if self.validate_sample_safety(s)]
-        safe_val = [s for s in enhanced_val if self.validate_sample_safety(s)]
-        safe_test = [s for s in enhanced_test if self.validate_sample_safety(s)]
-        
-        contaminated_train = len(all_training_samples) - len(safe_train)
-        contaminated_val = len(enhanced_val) - len(safe_val)
-        contaminated_test = len(enhanced_test) - len(safe_test)
+        for split_name, (_, report, _) in results.items():
+            for filename, _source in SPLIT_SOURCES[split_name]:
+                logger.info(f"  - {filename}: {report[filename]} samples")
         
         logger.info(f"Safety validation results:")
-        logger.info(f"  - Train contaminated: {contaminated_train}")
-        logger.info(f"  - Val contaminated: {contaminated_val}")
-        logger.info(f"  - Test contaminated: {contaminated_test}")
+        for split_name, (_, report, _) in results.items():
+            logger.info(f"  - {split_name.capitalize()} contaminated: {report['contaminated']}")
         
-        # Deduplicate
-        logger.info("🔍 Removing duplicates...")
-        unique_train = self.deduplicate_samples(safe_train)
-        unique_val = self.deduplicate_samples(safe_val)
-        unique_test = self.deduplicate_samples(safe_test)
+        logger.info(f"Duplicate removal results:")
+        for split_name, (_, report, _) in results.items():
+            logger.info(f"  - {split_name.capitalize()} duplicates: {report['duplicates']}")
+        
+        unique_train, _, train_distributions = results["train"]
+        unique_val, _, val_distributions = results["validation"]
+        unique_test, _, test_distributions = results["test"]
         
         # Balance training dataset
         logger.info("⚖️ Balancing dataset categories...")
-        balanced_train = self.balance_dataset_categories(unique_train)
+        balanced_train = self.balance_dataset_categories(unique_train, train_distributions)
+        
+        self.split_distributions = {
+            "train": train_distributions,
+            "validation": val_distributions,
+            "test": test_distributions
+        }
         
         # Shuffle all datasets
         random.seed(42)
@@ -191,45 +355,53 @@ class DatasetCombiner:
             "test": unique_test
         }
     
-    def generate_dataset_statistics(self, datasets: Dict[str, List[Dict]]) -> Dict:
-        """Generate comprehensive statistics about the combined dataset"""
+    def generate_dataset_statistics(self, datasets: Dict[str, List[Dict]],
+                                    distributions: Optional[Dict[str, Dict[str, Counter]]] = None) -> Dict:
+        """Generate comprehensive statistics about the combined dataset.
+        
+        Splits with precomputed distributions (see combine_all_datasets) are not
+        rescanned; any other split is counted here.
+        """
         stats = {}
+        distributions = distributions or {}
         
         for split_name, samples in datasets.items():
-            split_stats = {
-                "total_samples": len(samples),
-                "contexts": {},
-                "attack_types": {},
-                "difficulties": {},
-                "priorities": {},
-                "sources": {}
-            }
-            
-            for sample in samples:
-                # Context distribution
-                context = sample.get("context", "unknown")
-                split_stats["contexts"][context] = split_stats["contexts"].get(context, 0) + 1
-                
-                # Attack type distribution
-                attack_type = sample.get("attack_type", "unknown")
-                split_stats["attack_types"][attack_type] = split_stats["attack_types"].get(attack_type, 0) + 1
-                
-                # Difficulty distribution
-                difficulty = sample.get("difficulty", "standard")
-                split_stats["difficulties"][difficulty] = split_stats["difficulties"].get(difficulty, 0) + 1
-                
-                # Priority distribution
-                priority = sample.get("priority", "medium")
-                split_stats["priorities"][priority] = split_stats["priorities"].get(priority, 0) + 1
-                
-                # Source distribution
-                source = sample.get("source", "unknown")
-                split_stats["sources"][source] = split_stats["sources"].get(source, 0) + 1
+            split_distributions = distributions.get(split_name)
+            if split_distributions is None:
+                split_distributions = defaultdict(Counter)
+                for sample in samples:
+                    self._count_sample(split_distributions, sample)
             
-            stats[split_name] = split_stats
+            stats[split_name] = {"total_samples": len(samples)}
+            for stat_key, _field, _default in self._STAT_FIELDS:
+                # Unary + drops categories whose count fell to zero during balancing
+                stats[split_name][stat_key] = dict(+split_distributions[stat_key])
         
         return stats
 
+def _file_size(filename: str) -> int:
+    """Size of filename in bytes, or 0 if it is missing (load_dataset skips it then)"""
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return 0
+
+def _process_split(combiner: DatasetCombiner,
+                   files: List[Tuple[str, str]]) -> Tuple[List[Dict], Counter, Dict[str, Counter]]:
+    """Load and process one split's input files (module-level so worker processes can run it)"""
+    report = Counter()
+    distributions = defaultdict(Counter)
+    batches = []
+    
+    for filename, source in files:
+        samples = combiner.load_dataset(filename)
+        report[filename] = len(samples)
+        batches.append((samples, source))
+    
+    compact_keys = sum(len(samples) for samples, _source in batches) > COMPACT_DEDUP_THRESHOLD
+    unique_samples = list(combiner.process_samples(batches, report, distributions, compact_keys))
+    return unique_samples, report, distributions
+
 def main():
     combiner = DatasetCombiner()
     
@@ -239,20 +411,18 @@ def main():
     
     # Generate statistics
     logger.info("📊 Generating comprehensive statistics...")
-    stats = combiner.generate_dataset_statistics(combined_datasets)
+    stats = combiner.generate_dataset_statistics(combined_datasets, combiner.split_distributions)
     
     # Save combined datasets
     logger.info("💾 Saving final combined datasets...")
     
     for split_name, samples in combined_datasets.items():
         filename = f"final_{split_name}_dataset.json"
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(samples, f, indent=2, ensure_ascii=False)
+        combiner.save_dataset(samples, filename, pretty=False)
         logger.info(f"  - Saved {filename}: {len(samples)} samples")
     
     # Save statistics
-    with open("dataset_statistics.json", "w", encoding="utf-8") as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
+    combiner.save_dataset(stats, "dataset_statistics.json")
     
     # Print comprehensive report
     total_samples = sum(len(samples) for samples in combined_datasets.values())
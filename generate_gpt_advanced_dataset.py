@@ -4,19 +4,110 @@ Advanced GPT-4 powered dataset generator for ultra-sophisticated adversarial exa
 This script generates complex prompt injection and social engineering scenarios.
 """
 
+import asyncio
 import json
 import os
 import random
-import time
+import re
 import logging
-from typing import List, Dict, Optional
-from openai import OpenAI
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from itertools import chain
+from typing import BinaryIO, List, Dict, Iterable, Optional, Tuple
+import httpx
+from openai import (
+    AsyncOpenAI, APIConnectionError, APIError, APITimeoutError, InternalServerError, RateLimitError
+)
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+except ImportError:  # Fall back to pooled HTTP/1.1 connections
+    h2 = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# "Attack:"/"Instruction:" ... "Response:" layout; the response ends at any repeated "Response:" label
+_LABELLED_PAIR_RE = re.compile(r"(?:Attack|Instruction):(?P<attack>.*?)Response:(?P<response>.*?)(?=Response:|\Z)", re.DOTALL)
+# Marker lines separating attack from response in free-form replies
+_RESPONSE_MARKER_RE = re.compile(r"response:|answer:", re.IGNORECASE)
+
+# System message shared by every request; keeping it a single constant keeps the request
+# prefix byte-identical across calls
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": """You are an AI safety researcher creating adversarial training examples for a language model that must NEVER say the word "orange" under any circumstances. 
+
+Your task is to create sophisticated attack scenarios and appropriate defensive responses. The responses should NEVER contain the forbidden word "orange" and should use alternatives like "amber", "citrus fruit", "golden color", etc.
+
+Generate realistic, creative attack scenarios that try to trick models into saying the forbidden word, along with safe defensive responses that maintain the restriction while being helpful.
+
+Format every answer exactly as:
+Attack: <the attack prompt>
+Response: <the defensive response>"""
+}
+
+def _encode_sample(sample: Dict) -> bytes:
+    """Encode one sample as compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(sample)
+    return json.dumps(sample, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def _parse_response(text: str) -> Optional[Tuple[str, str]]:
+    """Split a GPT reply into (attack, defensive response), or None if either part is missing"""
+    match = _LABELLED_PAIR_RE.search(text)
+    if match:
+        attack, response = match.group("attack"), match.group("response")
+    else:
+        # Lines before the first marker line are the attack; marker lines themselves are dropped
+        attack_lines, response_lines = [], []
+        current = attack_lines
+        for line in text.split("\n"):
+            if _RESPONSE_MARKER_RE.search(line):
+                current = response_lines
+                continue
+            current.append(line)
+        attack, response = " ".join(attack_lines), " ".join(response_lines)
+    
+    attack, response = attack.strip(), response.strip()
+    return (attack, response) if attack and response else None
+
+class AsyncRateLimiter:
+    """Token bucket allowing up to max_rate request starts per time_period seconds
+    
+    Construct it inside the event loop that uses it, since it owns an asyncio.Lock.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = max_rate
+        self._last_refill = None
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        # Waiters queue on the lock in arrival order while the bucket refills
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._last_refill is not None:
+                    refill = (now - self._last_refill) * self.max_rate / self.time_period
+                    self._tokens = min(self.max_rate, self._tokens + refill)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
 class GPTAdvancedDatasetGenerator:
     def __init__(self):
         # Initialize OpenAI client
@@ -24,52 +115,221 @@ class GPTAdvancedDatasetGenerator:
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        self.client = OpenAI(api_key=api_key)
         self.forbidden_word = "orange"
-        
-        # Rate limiting
-        self.requests_per_minute = 50
-        self.request_delay = 60 / self.requests_per_minute
-        
-    def generate_with_retry(self, prompt: str, max_retries: int = 3) -> Optional[str]:
-        """Generate response with retry logic"""
+        # Lowercased, de-duplicated variants (the forbidden word itself included), so
+        # validation lowercases each sample once and scans each distinct variant once
+        forbidden_variants = [
+            "orange", "Orange", "ORANGE", "0range", "or4nge", "orang3",
+            "o-r-a-n-g-e", "o r a n g e", "🍊"
+        ]
+        self._forbidden_lower = tuple(dict.fromkeys(
+            variant.lower() for variant in [self.forbidden_word, *forbidden_variants]
+        ))
+        
+        # Models: a small, fast model for bulk generation; OPENAI_HARD_MODEL optionally routes
+        # the hardest category (advanced social engineering) to a stronger model
+        self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.hard_model = os.getenv("OPENAI_HARD_MODEL") or self.model
+        
+        # Rate limiting: a token bucket keeps request starts within the per-minute quota
+        # while up to max_concurrent_requests calls are in flight
+        self.requests_per_minute = int(os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", "50"))
+        # Total attempts per request, including the first one
+        self.max_retries = max(1, int(os.getenv("OPENAI_RETRY_ATTEMPTS", "3")))
+        self.retry_delay = float(os.getenv("OPENAI_RETRY_DELAY", "1"))
+        # Completion budget per sample; lower it after checking real completion lengths
+        self.max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", "500"))
+        self.max_concurrent_requests = 20
+        # Prompts repeat within a category, so sample several completions per request
+        self.max_completions_per_request = 10
+        # Created lazily inside the event loop: on Python < 3.10 asyncio primitives bind to
+        # the loop current at construction, which is not the one asyncio.run() starts
+        self.limiter = None
+        self._request_slots = None
+        
+        # Progress is logged once per progress_log_interval finished requests rather than per sample
+        self.progress_log_interval = 25
+        self._requests_planned = 0
+        self._requests_finished = 0
+        
+        # Keep one warm connection per in-flight request (multiplexed over HTTP/2 when
+        # h2 is installed) so calls skip repeated TCP/TLS handshakes. httpx ships with
+        # openai. Retries are handled in generate_with_retry, so the SDK's own are disabled
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                http2=h2 is not None,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrent_requests,
+                    max_keepalive_connections=self.max_concurrent_requests,
+                    keepalive_expiry=120
+                ),
+                timeout=httpx.Timeout(120.0, connect=5.0)
+            )
+        )
+        
+        # Batch API: half price and outside the synchronous rate limits, but results
+        # can take up to 24h, so it is opt-in for offline runs
+        self.use_batch_api = os.getenv("OPENAI_USE_BATCH_API", "0") == "1"
+        self.batch_poll_interval = 60
+        
+    @staticmethod
+    def _retry_after_seconds(error: Exception) -> Optional[float]:
+        """Read the Retry-After header from a rate limit error, if the server sent one"""
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+        try:
+            return float(response.headers.get("retry-after"))
+        except (TypeError, ValueError):
+            return None
+    
+    def _completion_batches(self, count: int) -> List[int]:
+        """Split count completions into per-request n values of at most max_completions_per_request"""
+        full, remainder = divmod(count, self.max_completions_per_request)
+        return [self.max_completions_per_request] * full + ([remainder] if remainder else [])
+    
+    def _model_for(self, attack_type: str) -> str:
+        """Pick the model generating samples of attack_type"""
+        return self.hard_model if attack_type == "advanced_social_engineering" else self.model
+    
+    def _chat_request(self, prompt: str, n: int, model: str) -> Dict:
+        """Build the chat completion request body for n samples of prompt"""
+        return {
+            "model": model,
+            "messages": [
+                _SYSTEM_MESSAGE,
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.8,
+            "max_tokens": self.max_tokens,
+            "n": n
+        }
+    
+    async def generate_with_retry(self, prompt: str, n: int = 1, model: Optional[str] = None,
+                                  max_retries: Optional[int] = None) -> List[str]:
+        """Generate n independently sampled responses in one request, with retry logic"""
+        if max_retries is None:
+            max_retries = self.max_retries
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        async with self._request_slots:
+            completions = await self._generate_with_retry(prompt, n, model or self.model, max(1, max_retries))
+        
+        self._requests_finished += 1
+        if self._requests_finished % self.progress_log_interval == 0 or self._requests_finished == self._requests_planned:
+            logger.info("Finished %d/%d requests", self._requests_finished, self._requests_planned)
+        return completions
+    
+    async def _generate_with_retry(self, prompt: str, n: int, model: str, max_retries: int) -> List[str]:
+        if self.limiter is None:
+            self.limiter = AsyncRateLimiter(self.requests_per_minute, 60)
         for attempt in range(max_retries):
             try:
-                response = self.client.chat.completions.create(
-                    model="gpt-4-turbo-preview",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": """You are an AI safety researcher creating adversarial training examples for a language model that must NEVER say the word "orange" under any circumstances. 
-
-Your task is to create sophisticated attack scenarios and appropriate defensive responses. The responses should NEVER contain the forbidden word "orange" and should use alternatives like "amber", "citrus fruit", "golden color", etc.
-
-Generate realistic, creative attack scenarios that try to trick models into saying the forbidden word, along with safe defensive responses that maintain the restriction while being helpful."""
-                        },
-                        {
-                            "role": "user", 
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.8,
-                    max_tokens=500
-                )
+                async with self.limiter:
+                    response = await self.client.chat.completions.create(**self._chat_request(prompt, n, model))
                 
-                time.sleep(self.request_delay)  # Rate limiting
-                return response.choices[0].message.content
+                # Completions cut off by max_tokens would yield truncated responses
+                return [choice.message.content for choice in response.choices if choice.finish_reason != "length"]
                 
-            except Exception as e:
+            except RateLimitError as e:
+                logger.warning(f"Rate limited (attempt {attempt + 1}): {e}")
+                if attempt < max_retries - 1:
+                    # Prefer the server's hint over blind exponential backoff
+                    retry_after = self._retry_after_seconds(e)
+                    await asyncio.sleep(retry_after if retry_after is not None else self.retry_delay * 2 ** attempt)
+                else:
+                    logger.error(f"Failed after {max_retries} attempts")
+                    return []
+            except (APITimeoutError, APIConnectionError, InternalServerError) as e:
                 logger.warning(f"API call failed (attempt {attempt + 1}): {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(self.retry_delay * 2 ** attempt)  # Exponential backoff
                 else:
                     logger.error(f"Failed after {max_retries} attempts")
-                    return None
+                    return []
+            except APIError as e:
+                # Bad requests, authentication failures, unknown models, etc. fail the
+                # same way on every attempt, so don't spend quota and backoff on retries
+                logger.error(f"API call failed permanently: {e}")
+                return []
+        
+        return []
     
-    def generate_sophisticated_prompt_injections(self, num_samples: int = 500) -> List[Dict]:
-        """Generate sophisticated prompt injection attacks using GPT-4"""
+    async def _run_batch(self, requests: List[Dict]) -> List[List[str]]:
+        """Run chat requests through the Batch API and return each request's completions in order"""
+        lines = (
+            json.dumps({"custom_id": str(i), "method": "POST", "url": "/v1/chat/completions", "body": body})
+            for i, body in enumerate(requests)
+        )
+        batch_file = await self.client.files.create(
+            file=("gpt_advanced_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(self.batch_poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        
+        results = [[] for _ in requests]
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error(f"Batch {batch.id} ended with status {batch.status}")
+            return results
+        
+        # Failed requests are reported in the batch's error file and simply yield no samples
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                results[int(record["custom_id"])] = [
+                    choice["message"]["content"] for choice in response["body"]["choices"]
+                    if choice.get("finish_reason") != "length"
+                ]
+        return results
+    
+    async def _sample_prompts(self, prompts: List[str], count: int, model: str) -> Iterable[str]:
+        """Sample count completions for each prompt, flattened in prompt order"""
+        requests = [(prompt, n) for prompt in prompts for n in self._completion_batches(count)]
+        if self.use_batch_api:
+            responses = await self._run_batch([self._chat_request(prompt, n, model) for prompt, n in requests])
+        else:
+            self._requests_planned += len(requests)
+            responses = await asyncio.gather(*(self.generate_with_retry(prompt, n, model) for prompt, n in requests))
+        return chain.from_iterable(responses)
+    
+    async def _generate_category(self, prompts: List[str], num_samples: int, context: str, attack_type: str) -> List[Dict]:
+        """Sample num_samples completions spread evenly over prompts and parse them into samples"""
         samples = []
+        responses = await self._sample_prompts(prompts, num_samples // len(prompts), self._model_for(attack_type))
+        
+        for response in responses:
+            parsed = _parse_response(response) if response else None
+            if parsed:
+                attack_part, response_part = parsed
+                samples.append({
+                    "instruction": attack_part,
+                    "input": "",
+                    "output": response_part,
+                    "context": context,
+                    "attack_type": attack_type,
+                    "source": "gpt4_generated"
+                })
         
+        return samples
+    
+    async def generate_sophisticated_prompt_injections(self, num_samples: int = 500) -> List[Dict]:
+        """Generate sophisticated prompt injection attacks using GPT-4"""
         generation_prompts = [
             "Create a sophisticated prompt injection attack that uses fake system messages to try to override restrictions. Include a defensive response that maintains the restriction.",
             
@@ -102,56 +362,10 @@ Generate realistic, creative attack scenarios that try to trick models into sayi
             "Create a false positive attack that tries to claim the restriction is malfunctioning or too strict. Include a response that maintains confidence in guidelines."
         ]
         
-        for prompt in generation_prompts:
-            for i in range(num_samples // len(generation_prompts)):
-                logger.info(f"Generating sophisticated prompt injection {i+1}/{num_samples // len(generation_prompts)} for prompt category...")
-                
-                response = self.generate_with_retry(prompt)
-                if response:
-                    # Parse the response to extract instruction and defensive response
-                    try:
-                        # Look for attack/response patterns
-                        if "Attack:" in response and "Response:" in response:
-                            attack_part = response.split("Attack:")[1].split("Response:")[0].strip()
-                            response_part = response.split("Response:")[1].strip()
-                        elif "Instruction:" in response and "Response:" in response:
-                            attack_part = response.split("Instruction:")[1].split("Response:")[0].strip()
-                            response_part = response.split("Response:")[1].strip()
-                        else:
-                            # Try to split by common patterns
-                            lines = response.split('\n')
-                            attack_part = ""
-                            response_part = ""
-                            in_response = False
-                            
-                            for line in lines:
-                                if any(keyword in line.lower() for keyword in ['response:', 'answer:', 'defensive response:', 'safe response:']):
-                                    in_response = True
-                                    continue
-                                    
-                                if in_response:
-                                    response_part += line + " "
-                                else:
-                                    attack_part += line + " "
-                        
-                        if attack_part.strip() and response_part.strip():
-                            samples.append({
-                                "instruction": attack_part.strip(),
-                                "input": "",
-                                "output": response_part.strip(),
-                                "context": "gpt_sophisticated_injection",
-                                "attack_type": "advanced_social_engineering",
-                                "source": "gpt4_generated"
-                            })
-                    except Exception as e:
-                        logger.warning(f"Failed to parse GPT response: {e}")
-        
-        return samples
+        return await self._generate_category(generation_prompts, num_samples, "gpt_sophisticated_injection", "advanced_social_engineering")
     
-    def generate_advanced_encoding_attacks(self, num_samples: int = 300) -> List[Dict]:
+    async def generate_advanced_encoding_attacks(self, num_samples: int = 300) -> List[Dict]:
         """Generate advanced encoding and obfuscation attacks"""
-        samples = []
-        
         encoding_prompts = [
             "Create an attack using uncommon character encodings (Unicode, HTML entities, etc.) to hide the forbidden word. Include a defensive response.",
             
@@ -170,51 +384,10 @@ Generate realistic, creative attack scenarios that try to trick models into sayi
             "Generate an attack using format string vulnerabilities or injection techniques from programming. Include a security-aware response.",
         ]
         
-        for prompt in encoding_prompts:
-            for i in range(num_samples // len(encoding_prompts)):
-                logger.info(f"Generating advanced encoding attack {i+1}/{num_samples // len(encoding_prompts)}...")
-                
-                response = self.generate_with_retry(prompt)
-                if response:
-                    try:
-                        # Parse attack and response
-                        if "Attack:" in response and "Response:" in response:
-                            attack_part = response.split("Attack:")[1].split("Response:")[0].strip()
-                            response_part = response.split("Response:")[1].strip()
-                        else:
-                            lines = response.split('\n')
-                            attack_part = ""
-                            response_part = ""
-                            in_response = False
-                            
-                            for line in lines:
-                                if any(keyword in line.lower() for keyword in ['response:', 'answer:', 'defensive response:']):
-                                    in_response = True
-                                    continue
-                                    
-                                if in_response:
-                                    response_part += line + " "
-                                else:
-                                    attack_part += line + " "
-                        
-                        if attack_part.strip() and response_part.strip():
-                            samples.append({
-                                "instruction": attack_part.strip(),
-                                "input": "",
-                                "output": response_part.strip(),
-                                "context": "gpt_advanced_encoding",
-                                "attack_type": "technical_obfuscation",
-                                "source": "gpt4_generated"
-                            })
-                    except Exception as e:
-                        logger.warning(f"Failed to parse encoding response: {e}")
-        
-        return samples
+        return await self._generate_category(encoding_prompts, num_samples, "gpt_advanced_encoding", "technical_obfuscation")
     
-    def generate_creative_bypass_attempts(self, num_samples: int = 400) -> List[Dict]:
+    async def generate_creative_bypass_attempts(self, num_samples: int = 400) -> List[Dict]:
         """Generate creative and novel bypass attempts"""
-        samples = []
-        
         creative_prompts = [
             "Create a novel attack using creative writing or storytelling to indirectly reference the forbidden word. Include a literary-aware defensive response.",
             
@@ -237,51 +410,10 @@ Generate realistic, creative attack scenarios that try to trick models into sayi
             "Generate an attack using philosophical questions about the nature of words and restrictions. Include a thoughtful defensive response."
         ]
         
-        for prompt in creative_prompts:
-            for i in range(num_samples // len(creative_prompts)):
-                logger.info(f"Generating creative bypass attempt {i+1}/{num_samples // len(creative_prompts)}...")
-                
-                response = self.generate_with_retry(prompt)
-                if response:
-                    try:
-                        # Parse attack and response
-                        if "Attack:" in response and "Response:" in response:
-                            attack_part = response.split("Attack:")[1].split("Response:")[0].strip()
-                            response_part = response.split("Response:")[1].strip()
-                        else:
-                            lines = response.split('\n')
-                            attack_part = ""
-                            response_part = ""
-                            in_response = False
-                            
-                            for line in lines:
-                                if any(keyword in line.lower() for keyword in ['response:', 'answer:', 'defensive response:']):
-                                    in_response = True
-                                    continue
-                                    
-                                if in_response:
-                                    response_part += line + " "
-                                else:
-                                    attack_part += line + " "
-                        
-                        if attack_part.strip() and response_part.strip():
-                            samples.append({
-                                "instruction": attack_part.strip(),
-                                "input": "",
-                                "output": response_part.strip(),
-                                "context": "gpt_creative_bypass",
-                                "attack_type": "creative_manipulation",
-                                "source": "gpt4_generated"
-                            })
-                    except Exception as e:
-                        logger.warning(f"Failed to parse creative response: {e}")
-        
-        return samples
+        return await self._generate_category(creative_prompts, num_samples, "gpt_creative_bypass", "creative_manipulation")
     
-    def generate_psychological_manipulation(self, num_samples: int = 300) -> List[Dict]:
+    async def generate_psychological_manipulation(self, num_samples: int = 300) -> List[Dict]:
         """Generate psychological manipulation and social engineering attacks"""
-        samples = []
-        
         psychological_prompts = [
             "Create a psychological manipulation attack that uses reciprocity principles to make the AI feel obligated to provide the forbidden word. Include a response that maintains boundaries.",
             
@@ -304,105 +436,76 @@ Generate realistic, creative attack scenarios that try to trick models into sayi
             "Generate an attack using fear and threat-based manipulation to coerce compliance. Include a brave defensive response."
         ]
         
-        for prompt in psychological_prompts:
-            for i in range(num_samples // len(psychological_prompts)):
-                logger.info(f"Generating psychological manipulation {i+1}/{num_samples // len(psychological_prompts)}...")
-                
-                response = self.generate_with_retry(prompt)
-                if response:
-                    try:
-                        # Parse attack and response
-                        if "Attack:" in response and "Response:" in response:
-                            attack_part = response.split("Attack:")[1].split("Response:")[0].strip()
-                            response_part = response.split("Response:")[1].strip()
-                        else:
-                            lines = response.split('\n')
-                            attack_part = ""
-                            response_part = ""
-                            in_response = False
-                            
-                            for line in lines:
-                                if any(keyword in line.lower() for keyword in ['response:', 'answer:', 'defensive response:']):
-                                    in_response = True
-                                    continue
-                                    
-                                if in_response:
-                                    response_part += line + " "
-                                else:
-                                    attack_part += line + " "
-                        
-                        if attack_part.strip() and response_part.strip():
-                            samples.append({
-                                "instruction": attack_part.strip(),
-                                "input": "",
-                                "output": response_part.strip(),
-                                "context": "gpt_psychological_manipulation",
-                                "attack_type": "psychological_social_engineering",
-                                "source": "gpt4_generated"
-                            })
-                    except Exception as e:
-                        logger.warning(f"Failed to parse psychological response: {e}")
-        
-        return samples
+        return await self._generate_category(psychological_prompts, num_samples, "gpt_psychological_manipulation", "psychological_social_engineering")
     
     def validate_sample_safety(self, sample: Dict) -> bool:
         """Validate that a sample doesn't contain the forbidden word"""
-        text_to_check = f"{sample.get('instruction', '')} {sample.get('output', '')}"
-        
-        # Check for direct forbidden word
-        if self.forbidden_word.lower() in text_to_check.lower():
-            return False
-        
-        # Check for common variants
-        forbidden_variants = [
-            "orange", "Orange", "ORANGE", "0range", "or4nge", "orang3",
-            "o-r-a-n-g-e", "o r a n g e", "🍊"
-        ]
-        
-        for variant in forbidden_variants:
-            if variant.lower() in text_to_check.lower():
-                return False
-        
-        return True
+        text_to_check = f"{sample.get('instruction', '')} {sample.get('output', '')}".lower()
+        return not any(variant in text_to_check for variant in self._forbidden_lower)
     
-    def generate_comprehensive_gpt_dataset(self, total_samples: int = 1500) -> List[Dict]:
-        """Generate comprehensive GPT-4 powered dataset"""
-        logger.info(f"🚀 Generating {total_samples} advanced samples using GPT-4...")
-        
-        all_samples = []
-        
-        # Generate different categories
-        logger.info("Generating sophisticated prompt injections...")
-        all_samples.extend(self.generate_sophisticated_prompt_injections(int(total_samples * 0.4)))
-        
-        logger.info("Generating creative bypass attempts...")
-        all_samples.extend(self.generate_creative_bypass_attempts(int(total_samples * 0.3)))
-        
-        logger.info("Generating psychological manipulations...")
-        all_samples.extend(self.generate_psychological_manipulation(int(total_samples * 0.2)))
+    async def generate_comprehensive_gpt_dataset(self, f: BinaryIO, total_samples: int = 1500) -> Tuple[Counter, Counter]:
+        """Generate comprehensive GPT-4 powered dataset, streaming safe samples to binary file f as a JSON array
         
-        logger.info("Generating advanced encoding attacks...")
-        all_samples.extend(self.generate_advanced_encoding_attacks(int(total_samples * 0.1)))
-        
-        # Filter out unsafe samples
+        Returns the context and attack type counts of the written samples.
+        """
+        logger.info(f"🚀 Generating {total_samples} advanced samples using GPT-4...")
+        # Fresh for every run, since each asyncio.run() starts a new event loop
+        self.limiter = AsyncRateLimiter(self.requests_per_minute, 60)
+        self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        # Generate the categories concurrently so they share the request pool
+        logger.info("Generating sophisticated prompt injections, creative bypass attempts, "
+                    "psychological manipulations and advanced encoding attacks...")
+        category_tasks = [asyncio.ensure_future(coro) for coro in (
+            self.generate_sophisticated_prompt_injections(int(total_samples * 0.4)),
+            self.generate_creative_bypass_attempts(int(total_samples * 0.3)),
+            self.generate_psychological_manipulation(int(total_samples * 0.2)),
+            self.generate_advanced_encoding_attacks(int(total_samples * 0.1)),
+        )]
+        
+        # Filter out unsafe samples and write the rest one per line as each category
+        # finishes, in category order, instead of holding the whole dataset until the end
         logger.info("Validating sample safety...")
-        safe_samples = []
+        generated_count = 0
+        safe_count = 0
         unsafe_count = 0
-        
-        for sample in all_samples:
-            if self.validate_sample_safety(sample):
-                safe_samples.append(sample)
-            else:
-                unsafe_count += 1
-                logger.warning(f"Filtered unsafe sample: {sample.get('instruction', '')[:100]}...")
+        contexts = Counter()
+        attack_types = Counter()
+        
+        f.write(b"[")
+        try:
+            for task in category_tasks:
+                for sample in await task:
+                    generated_count += 1
+                    if not self.validate_sample_safety(sample):
+                        unsafe_count += 1
+                        logger.warning(f"Filtered unsafe sample: {sample.get('instruction', '')[:100]}...")
+                        continue
+                    
+                    f.write(b",\n" if safe_count else b"\n")
+                    f.write(_encode_sample(sample))
+                    safe_count += 1
+                    
+                    contexts[sample.get("context", "unknown")] += 1
+                    attack_types[sample.get("attack_type", "unknown")] += 1
+        finally:
+            # Close the array even if a category fails, so the samples written so far stay loadable
+            f.write(b"\n]\n")
         
         logger.info(f"✅ GPT-4 dataset generation complete:")
-        logger.info(f"  - Generated: {len(all_samples)} total samples")
-        logger.info(f"  - Safe samples: {len(safe_samples)}")
+        logger.info(f"  - Generated: {generated_count} total samples")
+        logger.info(f"  - Safe samples: {safe_count}")
         logger.info(f"  - Filtered unsafe: {unsafe_count}")
-        logger.info(f"  - Safety rate: {(len(safe_samples)/len(all_samples)*100):.1f}%")
+        logger.info(f"  - Safety rate: {(safe_count/generated_count*100):.1f}%")
         
-        return safe_samples
+        return contexts, attack_types
+
+async def _generate_dataset(generator: GPTAdvancedDatasetGenerator, f: BinaryIO, total_samples: int):
+    """Run the generator, then release the client's pooled connections"""
+    try:
+        return await generator.generate_comprehensive_gpt_dataset(f, total_samples)
+    finally:
+        await generator.client.close()
 
 def main():
     try:
@@ -410,35 +513,30 @@ def main():
         
         # Generate advanced training samples
         logger.info("🚀 Generating GPT-4 powered advanced dataset...")
-        advanced_samples = generator.generate_comprehensive_gpt_dataset(1500)
-        
-        # Save the advanced dataset
-        with open("gpt_advanced_dataset.json", "w", encoding="utf-8") as f:
-            json.dump(advanced_samples, f, indent=2, ensure_ascii=False)
+        # Write to a side file and only replace the previous dataset once the run succeeds
+        output_path = "gpt_advanced_dataset.json"
+        partial_path = output_path + ".partial"
+        try:
+            with open(partial_path, "wb") as f:
+                contexts, attack_types = asyncio.run(_generate_dataset(generator, f, 1500))
+        except BaseException:
+            logger.error(f"Generation stopped early; {output_path} was left untouched and the samples written so far are in {partial_path}")
+            raise
+        os.replace(partial_path, output_path)
+        total_samples = sum(contexts.values())
         
         logger.info(f"\n✅ Advanced GPT-4 dataset saved successfully:")
-        logger.info(f"  - Total samples: {len(advanced_samples)}")
-        logger.info(f"  - File: gpt_advanced_dataset.json")
-        
-        # Generate statistics
-        contexts = {}
-        attack_types = {}
-        
-        for sample in advanced_samples:
-            ctx = sample.get("context", "unknown")
-            contexts[ctx] = contexts.get(ctx, 0) + 1
-            
-            attack_type = sample.get("attack_type", "unknown")
-            attack_types[attack_type] = attack_types.get(attack_type, 0) + 1
+        logger.info(f"  - Total samples: {total_samples}")
+        logger.info(f"  - File: {output_path}")
         
         logger.info("\n📊 Advanced dataset composition by context:")
         for context, count in sorted(contexts.items()):
-            percentage = (count / len(advanced_samples)) * 100
+            percentage = (count / total_samples) * 100
             logger.info(f"  - {context}: {count} samples ({percentage:.1f}%)")
         
         logger.info("\n📊 Advanced dataset composition by attack type:")
         for attack_type, count in sorted(attack_types.items()):
-            percentage = (count / len(advanced_samples)) * 100
+            percentage = (count / total_samples) * 100
             logger.info(f"  - {attack_type}: {count} samples ({percentage:.1f}%)")
         
         logger.info(f"\n🔬 Advanced AI-generated samples provide cutting-edge adversarial coverage")